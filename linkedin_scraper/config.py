@@ -1,6 +1,8 @@
+import logging
 import os
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
 from dotenv import load_dotenv
 
@@ -45,27 +47,72 @@ class ScraperConfig:
         "uruguay": "100867946",
     }
 
+    def __post_init__(self):
+        # Normalize keywords once so filtering never has to do it per job.
+        self.contains = [k.strip().lower() for k in self.contains if k.strip()]
+        self.non_contains = [k.strip().lower() for k in self.non_contains if k.strip()]
+
     @classmethod
-    def from_env(cls):
+    @lru_cache(maxsize=1)
+    def _parse_env(cls) -> Tuple[Tuple[str, Any], ...]:
+        """
+        Reads and normalizes settings from the environment once.
+
+        Unknown locations are dropped with a warning, blank keywords are
+        dropped silently.
+
+        Returns:
+            Immutable (field, value) pairs for building a config
+        """
         load_dotenv()
-        locations = os.getenv("LOCATIONS", "").lower().split(",")
-        geo_ids = [cls.LOCATION_MAP.get(location.strip()) for location in locations]
-        return cls(
-            keywords=os.getenv("KEYWORDS", ""),
-            geo_ids=[
-                cls.LOCATION_MAP.get(loc.strip())
-                for loc in os.getenv("LOCATIONS", "").lower().split(",")
-                if loc.strip()
-            ],
-            date_filter=cls.DATE_FILTER_MAP.get(os.getenv("DATE_FILTER", "past_24h")),
-            contains=[
-                k.strip() for k in os.getenv("CONTAINS", "").split(",") if k.strip()
-            ],
-            non_contains=[
-                k.strip() for k in os.getenv("NON_CONTAINS", "").split(",") if k.strip()
-            ],
-            linkedin_email=os.getenv("LINKEDIN_EMAIL"),
-            linkedin_password=os.getenv("LINKEDIN_PASSWORD"),
-            headless=os.getenv("HEADLESS", "false").lower() == "true",
-            output_file=os.getenv("OUTPUT_FILE", "jobs.json"),
+        locations = [
+            loc.strip()
+            for loc in os.getenv("LOCATIONS", "").lower().split(",")
+            if loc.strip()
+        ]
+
+        for loc in locations:
+            if loc not in cls.LOCATION_MAP:
+                logging.getLogger("linkedin_scraper").warning(
+                    "Unknown location %r, supported locations: %s",
+                    loc,
+                    ", ".join(cls.LOCATION_MAP),
+                )
+
+        return (
+            ("keywords", os.getenv("KEYWORDS", "")),
+            (
+                "geo_ids",
+                tuple(
+                    cls.LOCATION_MAP[loc] for loc in locations if loc in cls.LOCATION_MAP
+                ),
+            ),
+            (
+                "date_filter",
+                cls.DATE_FILTER_MAP.get(os.getenv("DATE_FILTER", "past_24h")),
+            ),
+            (
+                "contains",
+                tuple(
+                    k.strip() for k in os.getenv("CONTAINS", "").split(",") if k.strip()
+                ),
+            ),
+            (
+                "non_contains",
+                tuple(
+                    k.strip()
+                    for k in os.getenv("NON_CONTAINS", "").split(",")
+                    if k.strip()
+                ),
+            ),
+            ("linkedin_email", os.getenv("LINKEDIN_EMAIL")),
+            ("linkedin_password", os.getenv("LINKEDIN_PASSWORD")),
+            ("headless", os.getenv("HEADLESS", "false").lower() == "true"),
+            ("output_file", os.getenv("OUTPUT_FILE", "jobs.json")),
         )
+
+    @classmethod
+    def from_env(cls):
+        settings = dict(cls._parse_env())
+        settings["geo_ids"] = list(settings["geo_ids"])
+        return cls(**settings)
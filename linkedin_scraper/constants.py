@@ -3,7 +3,10 @@ class LinkedInConstants:
 
     LOGIN_URL = f"{BASE_URL}/login"
     JOBS_SEARCH_URL = f"{BASE_URL}/jobs/search"
+    JOB_POSTING_URL = f"{BASE_URL}/jobs-guest/jobs/api/jobPosting"
 
+    SESSION_COOKIE = "li_at"
+    LOGGED_IN_CSS = "input.search-global-typeahead__input"
     JOB_ID_ATTRIBUTE = "data-job-id"
     NEXT_PAGE_BUTTON_CSS = "li.active + li"
     DESCRIPTION_CLASS = "jobs-description__content"
@@ -13,6 +16,17 @@ class LinkedInConstants:
     COMPANY_NAME_CLASS = "job-details-jobs-unified-top-card__company-name"
     LOCATION_CLASS = "job-details-jobs-unified-top-card__primary-description-container"
 
+    GUEST_JOB_TITLE_CLASS = "top-card-layout__title"
+    GUEST_COMPANY_NAME_CLASS = "topcard__org-name-link"
+    GUEST_DESCRIPTION_CLASS = "description__text"
+    GUEST_LOCATION_CLASS = "topcard__flavor--bullet"
+
     WAIT_SHORT = 5
     WAIT_MEDIUM = 10
     WAIT_LONG = 15
+
+    REQUEST_TIMEOUT = 10
+    MAX_WORKERS = 16
+    REQUESTS_PER_SECOND = 5
+
+    DB_BATCH_SIZE = 100
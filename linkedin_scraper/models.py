@@ -1,9 +1,11 @@
+import os
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import (Boolean, Column, DateTime, Integer, String, Text,
-                        create_engine)
+from sqlalchemy import (Boolean, Column, DateTime, Index, Integer, String,
+                        Text, create_engine, event)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.pool import StaticPool
 
 
 class Base(DeclarativeBase):
@@ -14,9 +16,10 @@ class Job(Base):
     """Job listing database model."""
 
     __tablename__ = "jobs"
+    __table_args__ = (Index("ix_jobs_scraped", "success", "scraped_date"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    job_id: Mapped[str] = mapped_column(String, unique=True)
+    job_id: Mapped[str] = mapped_column(String, unique=True, index=True)
     title: Mapped[Optional[str]] = mapped_column(String)
     company: Mapped[Optional[str]] = mapped_column(String)
     description: Mapped[Optional[str]] = mapped_column(Text)
@@ -27,8 +30,32 @@ class Job(Base):
     error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Enables WAL journaling and relaxed syncing on each new connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.close()
+
+
 def init_db():
     """Initialize SQLite database and create tables."""
-    engine = create_engine("sqlite:///jobs.db", echo=True)
+    engine = create_engine(
+        "sqlite:///jobs.db",
+        echo=os.getenv("SQL_ECHO", "false").lower() == "true",
+        connect_args={"check_same_thread": False, "timeout": 30},
+        poolclass=StaticPool,
+    )
+    event.listen(engine, "connect", _set_sqlite_pragmas)
     Base.metadata.create_all(engine)
+
+    # create_all only adds indexes together with new tables, so backfill the
+    # query index on databases created before it was declared. The job_id
+    # index is left out since the UNIQUE constraint already indexes it there.
+    for index in Job.__table__.indexes:
+        if index.name == "ix_jobs_scraped":
+            index.create(engine, checkfirst=True)
+
     return engine
@@ -1,22 +1,49 @@
 import json
+import logging
+import os
 import random
-import time
-from typing import Dict, List, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, List, Optional, Set
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import (NoSuchElementException,
+                                        TimeoutException, WebDriverException)
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import sessionmaker
 
 from linkedin_scraper.config import ScraperConfig
 from linkedin_scraper.constants import LinkedInConstants
 from linkedin_scraper.models import Job, init_db
-from linkedin_scraper.utils import retry_on_failure, setup_logging
+from linkedin_scraper.utils import (RateLimiter, TransientHTTPError,
+                                    retry_on_failure, setup_logging)
+
+# Only the job detail nodes are parsed out of the guest job posting page. The
+# class is matched with a regex because parse_only compares class_ against the
+# whole class attribute, and these nodes all carry several classes.
+JOB_DETAILS_STRAINER = SoupStrainer(
+    class_=re.compile(
+        r"(^|\s)(%s)(\s|$)"
+        % "|".join(
+            re.escape(class_name)
+            for class_name in (
+                LinkedInConstants.GUEST_JOB_TITLE_CLASS,
+                LinkedInConstants.GUEST_COMPANY_NAME_CLASS,
+                LinkedInConstants.GUEST_DESCRIPTION_CLASS,
+                LinkedInConstants.GUEST_LOCATION_CLASS,
+            )
+        )
+    )
+)
 
 
 class LinkedInJobScraper:
@@ -34,6 +61,20 @@ class LinkedInJobScraper:
             "DNT": "1",
         }
 
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=LinkedInConstants.MAX_WORKERS,
+            pool_maxsize=LinkedInConstants.MAX_WORKERS,
+        )
+        self.session.mount("https://", adapter)
+        self.rate_limiter = RateLimiter(LinkedInConstants.REQUESTS_PER_SECOND)
+
+        self._driver: Optional[webdriver.Chrome] = None
+
+        self._contains_re = self._compile_keywords(self.config.contains)
+        self._non_contains_re = self._compile_keywords(self.config.non_contains)
+
     def scrape_jobs(self) -> None:
         """
         Main scraping function for LinkedIn jobs.
@@ -43,47 +84,114 @@ class LinkedInJobScraper:
         Finally saves both successful and failed jobs to output file.
         """
         self.logger.info("Starting scraping process...")
-        options = webdriver.ChromeOptions()
+        driver = self._get_driver()
 
-        if self.config.headless:
-            self.logger.info("Running in headless mode")
-            options.add_argument("--headless")
-
-        driver = webdriver.Chrome(options=options)
-        self.logger.info("Browser initialized")
-
-        job_ids = []
+        job_ids = set()
         all_jobs = []
         failed_jobs = []
 
-        try:
+        if not self._is_logged_in(driver):
             self._login(driver)
 
-            for geo_id in self.config.geo_ids:
-                ids = self._get_all_job_ids(driver, self.config.keywords, geo_id)
-                job_ids.extend(ids)
+        seen_job_ids = self._get_saved_job_ids()
+
+        for geo_id in self.config.geo_ids:
+            ids = self._get_all_job_ids(driver, self.config.keywords, geo_id)
+            job_ids.update(ids)
+
+        job_ids -= seen_job_ids
 
-            for job_id in job_ids:
+        self.logger.info("%d new jobs to fetch", len(job_ids))
+
+        with ThreadPoolExecutor(max_workers=LinkedInConstants.MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(self._get_job_details, job_id): job_id
+                for job_id in job_ids
+            }
+
+            for future in as_completed(futures):
+                job_id = futures[future]
                 try:
-                    details = self._get_job_details(driver, job_id)
-                    if details and self._should_include_job(details):
+                    details = future.result()
+                    if details is None:
+                        failed_jobs.append({"job_id": job_id, "error": "parse failed"})
+                    elif self._should_include_job(details):
                         self.logger.info("Job included")
                         all_jobs.append(details)
                     else:
                         self.logger.info("Job excluded")
                 except Exception as e:
-                    self.logger.error(f"Error: {e}")
-                    continue
-        finally:
-            driver.quit()
+                    self.logger.error("Error: %s", e)
+                    failed_jobs.append({"job_id": job_id, "error": str(e)})
 
         self.logger.info(
-            f"Found {len(all_jobs)} successful jobs and {len(failed_jobs)} failed jobs"
+            "Found %d successful jobs and %d failed jobs",
+            len(all_jobs),
+            len(failed_jobs),
         )
 
         if len(all_jobs) > 0 or len(failed_jobs) > 0:
             self._save_results(all_jobs, failed_jobs)
 
+    def close(self) -> None:
+        """Shuts down the browser and HTTP session."""
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except WebDriverException:
+                pass
+            self._driver = None
+        self.session.close()
+
+    def _get_driver(self) -> webdriver.Chrome:
+        """
+        Returns the cached browser, launching a new one if none is alive.
+
+        Returns:
+            Selenium webdriver instance
+        """
+        if self._driver is not None and self._driver.session_id:
+            try:
+                # Cheap round-trip to detect a crashed or closed browser.
+                self._driver.current_url
+                return self._driver
+            except WebDriverException:
+                self.logger.warning("Browser session lost, starting a new one")
+                try:
+                    self._driver.quit()
+                except WebDriverException:
+                    pass
+
+        options = webdriver.ChromeOptions()
+
+        if self.config.headless:
+            self.logger.info("Running in headless mode")
+            options.add_argument("--headless")
+
+        # Images are never read, and returning on DOMContentLoaded is enough
+        # since every page interaction waits for its own elements.
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.page_load_strategy = "eager"
+
+        self._driver = webdriver.Chrome(options=options)
+        self.logger.info("Browser initialized")
+        return self._driver
+
+    def _is_logged_in(self, driver: webdriver.Chrome) -> bool:
+        """
+        Checks if the browser already holds a LinkedIn session cookie.
+
+        Args:
+            driver: Selenium webdriver instance
+        """
+        try:
+            return driver.get_cookie(LinkedInConstants.SESSION_COOKIE) is not None
+        except WebDriverException:
+            return False
+
     def _scroll_job_listings(self, driver: webdriver.Chrome):
         """
         Scroll jobs listing's section until all jobs cards are displayed.
@@ -92,12 +200,12 @@ class LinkedInJobScraper:
             driver: Selenium webdriver instance
         """
         try:
-            self.logger.info(f"Scrolling current page...")
+            self.logger.info("Scrolling current page...")
             max_attempts = 3
             attempts = 0
 
             while attempts < max_attempts:
-                self.logger.info(f"Attemp: {attempts}")
+                self.logger.info("Attempt: %d", attempts)
 
                 job_cards = driver.find_elements(
                     By.CSS_SELECTOR, LinkedInConstants.JOB_LIST_CSS
@@ -106,27 +214,58 @@ class LinkedInJobScraper:
                     "arguments[0].scrollIntoView(true);", job_cards[-1]
                 )
 
-                time.sleep(LinkedInConstants.WAIT_SHORT)
-
-                footer_element = driver.find_element(
-                    By.ID, LinkedInConstants.JOBS_SEARCH_FOOTER_ID
-                )
-
-                is_visible = driver.execute_script(
-                    "var rect = arguments[0].getBoundingClientRect();"
-                    "return (rect.top >= 0 && rect.bottom <= window.innerHeight);",
-                    footer_element,
-                )
+                try:
+                    WebDriverWait(driver, LinkedInConstants.WAIT_SHORT).until(
+                        lambda d: self._is_footer_visible(d)
+                        or len(
+                            d.find_elements(
+                                By.CSS_SELECTOR, LinkedInConstants.JOB_LIST_CSS
+                            )
+                        )
+                        > len(job_cards)
+                    )
+                except TimeoutException:
+                    pass
 
-                if is_visible:
+                if self._is_footer_visible(driver):
                     self.logger.info("Pagination element found!")
                     return
                 attempts += 1
 
         except Exception as e:
-            self.logger.error(f"Error scrolling page: {str(e)}")
+            self.logger.error("Error scrolling page: %s", e)
             return None
 
+    def _is_footer_visible(self, driver: webdriver.Chrome) -> bool:
+        """
+        Checks if the search results footer is inside the viewport.
+
+        Args:
+            driver: Selenium webdriver instance
+        """
+        footer_element = driver.find_element(
+            By.ID, LinkedInConstants.JOBS_SEARCH_FOOTER_ID
+        )
+
+        return driver.execute_script(
+            "var rect = arguments[0].getBoundingClientRect();"
+            "return (rect.top >= 0 && rect.bottom <= window.innerHeight);",
+            footer_element,
+        )
+
+    def _wait_for_job_list(self, driver: webdriver.Chrome) -> None:
+        """
+        Waits until job cards are present on the current search page.
+
+        Args:
+            driver: Selenium webdriver instance
+        """
+        WebDriverWait(driver, LinkedInConstants.WAIT_MEDIUM).until(
+            EC.presence_of_element_located(
+                (By.CSS_SELECTOR, LinkedInConstants.JOB_LIST_CSS)
+            )
+        )
+
     def _get_job_ids(self, driver: webdriver.Chrome, current_page: int) -> List[str]:
         """
         Gets job IDs from LinkedIn current search page.
@@ -137,33 +276,26 @@ class LinkedInJobScraper:
             List of job IDs found on the current search page
         """
 
-        job_ids = set()
-
         try:
-            self.logger.info(f"Getting jobs in page #{current_page}")
+            self.logger.info("Getting jobs in page #%d", current_page)
 
             self._scroll_job_listings(driver)
 
-            job_cards = driver.find_elements(
-                By.CSS_SELECTOR, LinkedInConstants.JOB_LIST_CSS
+            # Read every card's ID in a single script call instead of one
+            # webdriver round-trip per card.
+            job_ids = set(
+                driver.execute_script(
+                    "return Array.from(document.querySelectorAll(arguments[0]),"
+                    " card => card.getAttribute(arguments[1])).filter(Boolean);",
+                    LinkedInConstants.JOB_LIST_CSS,
+                    LinkedInConstants.JOB_ID_ATTRIBUTE,
+                )
             )
 
-            self.logger.info(f"Found {len(job_cards)} job cards in this page")
-
-            for card in job_cards:
-                try:
-                    if job_id := card.get_attribute(LinkedInConstants.JOB_ID_ATTRIBUTE):
-                        job_ids.add(job_id)
-                except StaleElementReferenceException:
-                    continue
-                except Exception as e:
-                    self.logger.error(f"Error extracting job ID: {str(e)}")
-                    continue
-
-            self.logger.info(f"Total job IDs extracted in this page: {len(job_ids)}")
+            self.logger.info("Total job IDs extracted in this page: %d", len(job_ids))
 
         except Exception as e:
-            self.logger.error(f"Error extracting jobs ids: {str(e)}")
+            self.logger.error("Error extracting jobs ids: %s", e)
             return None
 
         return list(job_ids)
@@ -172,16 +304,18 @@ class LinkedInJobScraper:
         self, driver: webdriver.Chrome, keyword: str, geo_id: str
     ) -> List[str]:
         """Gets all jobs IDs from LinkedIn search pages."""
-        self.logger.info(f"Getting all jobs for keyword: {keyword}, geo_id: {geo_id}")
+        self.logger.info(
+            "Getting all jobs for keyword: %s, geo_id: %s", keyword, geo_id
+        )
 
         url = f"{LinkedInConstants.JOBS_SEARCH_URL}?keywords={keyword}&f_TPR={self.config.date_filter}&geoId={geo_id}"
         driver.get(url)
-        time.sleep(LinkedInConstants.WAIT_MEDIUM)
 
         current_page = 0 + 1
         all_job_ids = set()
 
         try:
+            self._wait_for_job_list(driver)
             all_job_ids.update(self._get_job_ids(driver, current_page))
 
             while True:
@@ -190,14 +324,15 @@ class LinkedInJobScraper:
                     next_button = driver.find_element(
                         By.CSS_SELECTOR, LinkedInConstants.NEXT_PAGE_BUTTON_CSS
                     )
+                    first_card = driver.find_element(
+                        By.CSS_SELECTOR, LinkedInConstants.JOB_LIST_CSS
+                    )
                     next_button.click()
 
-                    # This isn't the best approack, I should wait for an element,
-                    # but for the rate limit it's better to wait some more time 🤷
-                    self.logger.info(
-                        f"Waiting {LinkedInConstants.WAIT_SHORT}s before continue..."
+                    WebDriverWait(driver, LinkedInConstants.WAIT_SHORT).until(
+                        EC.staleness_of(first_card)
                     )
-                    time.sleep(LinkedInConstants.WAIT_SHORT)
+                    self._wait_for_job_list(driver)
 
                     all_job_ids.update(self._get_job_ids(driver, current_page))
 
@@ -207,57 +342,103 @@ class LinkedInJobScraper:
 
         except Exception as e:
             self.logger.info(e)
-            self.logger.error(f"Error during job extraction: {str(e)}")
+            self.logger.error("Error during job extraction: %s", e)
 
         job_ids_list = list(all_job_ids)
-        self.logger.info(f"Total unique job IDs extracted: {len(job_ids_list)}")
+        self.logger.info("Total unique job IDs extracted: %d", len(job_ids_list))
         return job_ids_list
 
-    def _get_job_details(self, driver: webdriver.Chrome, job_id: str) -> Optional[Dict]:
+    @retry_on_failure()
+    def _fetch_job_posting(self, job_id: str) -> str:
+        """
+        Downloads the guest job posting page.
+
+        Connection errors, timeouts, 429 and 5xx responses are retried. Other
+        error responses (e.g. 404 for a removed posting) are raised right away.
+
+        Args:
+            job_id: LinkedIn job ID
+
+        Returns:
+            Raw HTML of the job posting
+        """
+        self.rate_limiter.wait()
+        response = self.session.get(
+            f"{LinkedInConstants.JOB_POSTING_URL}/{job_id}",
+            timeout=LinkedInConstants.REQUEST_TIMEOUT,
+        )
+
+        if response.status_code == 429 or response.status_code >= 500:
+            raise TransientHTTPError(
+                f"{response.status_code} error fetching job {job_id}",
+                response=response,
+            )
+
+        response.raise_for_status()
+        return response.text
+
+    def _get_job_details(self, job_id: str) -> Optional[Dict]:
         """
         Gets detailed information for a specific job.
 
+        Uses LinkedIn's guest job posting endpoint, which returns static HTML,
+        so no browser round-trip is needed.
+
         Args:
-            driver: Selenium webdriver instance
             job_id: LinkedIn job ID
 
         Returns:
             Dictionary containing job details or None if extraction fails
+
+        Raises:
+            requests.RequestException: If the page can't be fetched after retries
         """
 
-        self.logger.info(f"Getting details for job {job_id}")
+        self.logger.info("Getting details for job %s", job_id)
 
         url = f"{LinkedInConstants.BASE_URL}/jobs/search/?currentJobId={job_id}"
-        driver.get(url)
-        time.sleep(LinkedInConstants.WAIT_MEDIUM)
+        html = self._fetch_job_posting(job_id)
 
         try:
+            soup = BeautifulSoup(html, "lxml", parse_only=JOB_DETAILS_STRAINER)
 
             details = {
                 "job_id": job_id,
-                "title": driver.find_element(
-                    By.CLASS_NAME, LinkedInConstants.JOB_TITLE_CLASS
-                ).text,
-                "company": driver.find_element(
-                    By.CLASS_NAME, LinkedInConstants.COMPANY_NAME_CLASS
-                ).text,
-                "description": driver.find_element(
-                    By.CLASS_NAME, LinkedInConstants.DESCRIPTION_CLASS
-                ).text,
+                "title": soup.find(
+                    class_=LinkedInConstants.GUEST_JOB_TITLE_CLASS
+                ).get_text(strip=True),
+                "company": soup.find(
+                    class_=LinkedInConstants.GUEST_COMPANY_NAME_CLASS
+                ).get_text(strip=True),
+                "description": soup.find(
+                    class_=LinkedInConstants.GUEST_DESCRIPTION_CLASS
+                ).get_text("\n", strip=True),
                 "url": url,
-                "location": driver.find_element(
-                    By.CLASS_NAME,
-                    LinkedInConstants.LOCATION_CLASS,
-                )
-                .find_element(By.TAG_NAME, "span")
-                .text,
+                "location": soup.find(
+                    class_=LinkedInConstants.GUEST_LOCATION_CLASS
+                ).get_text(strip=True),
             }
-            self.logger.info(f"Extracted job details for {job_id}")
+            self.logger.info("Extracted job details for %s", job_id)
             return details
 
         except Exception as e:
-            self.logger.error(f"Error extracting job {job_id}: {str(e)}")
+            self.logger.error("Error extracting job %s: %s", job_id, e)
+            return None
+
+    @staticmethod
+    def _compile_keywords(keywords: List[str]) -> Optional[re.Pattern]:
+        """
+        Compiles a keyword list into a single alternation pattern.
+
+        Args:
+            keywords: Lowercase keywords to match
+
+        Returns:
+            Compiled pattern or None if there are no keywords
+        """
+        if not keywords:
             return None
+        return re.compile("|".join(re.escape(keyword) for keyword in keywords))
 
     def _should_include_job(self, job_details: Dict) -> bool:
         """
@@ -269,20 +450,27 @@ class LinkedInJobScraper:
         Returns:
             True if job should be included based on contains/non_contains filters
         """
-        content = " ".join(str(value).lower() for value in job_details.values())
-
-        print("Keyword matches:")
-
-        for keyword in self.config.contains:
-            print(f"{keyword}: {keyword.lower() in content}")
+        if not self._contains_re and not self._non_contains_re:
+            return True
+
+        content = "\n".join(
+            job_details.get(field) or ""
+            for field in ("title", "company", "location", "description")
+        ).lower()
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Keyword matches for job %s: contains=%s non_contains=%s",
+                job_details.get("job_id"),
+                [k for k in self.config.contains if k in content],
+                [k for k in self.config.non_contains if k in content],
+            )
 
-        if self.config.contains:
-            if not any(keyword.lower() in content for keyword in self.config.contains):
-                return False
+        if self._contains_re and not self._contains_re.search(content):
+            return False
 
-        if self.config.non_contains:
-            if any(keyword.lower() in content for keyword in self.config.non_contains):
-                return False
+        if self._non_contains_re and self._non_contains_re.search(content):
+            return False
 
         return True
 
@@ -306,8 +494,30 @@ class LinkedInJobScraper:
         driver.find_element(By.ID, "password").send_keys(self.config.linkedin_password)
         driver.find_element(By.CSS_SELECTOR, "[type=submit]").click()
 
-        # I need time to pass the manual validation!
-        time.sleep(LinkedInConstants.WAIT_LONG)
+        # Leave time to pass the manual validation, but move on as soon as
+        # the logged in navigation bar shows up.
+        try:
+            WebDriverWait(driver, LinkedInConstants.WAIT_LONG).until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, LinkedInConstants.LOGGED_IN_CSS)
+                )
+            )
+        except TimeoutException:
+            self.logger.warning("Login confirmation not found, continuing anyway")
+
+    def _get_saved_job_ids(self) -> Set[str]:
+        """
+        Gets the IDs of jobs already saved successfully in the database.
+
+        Returns:
+            Set of job IDs that don't need to be fetched again
+        """
+        session = self.Session()
+
+        try:
+            return set(session.scalars(select(Job.job_id).where(Job.success.is_(True))))
+        finally:
+            session.close()
 
     def _save_results_json(self, jobs: List[Dict], failed_jobs: List[Dict]) -> None:
         """
@@ -335,7 +545,10 @@ class LinkedInJobScraper:
             json.dump(output, f, ensure_ascii=False, indent=2)
 
         self.logger.info(
-            f"Saved {len(jobs)} successful and {len(failed_jobs)} failed jobs to: {output_path}"
+            "Saved %d successful and %d failed jobs to: %s",
+            len(jobs),
+            len(failed_jobs),
+            output_path,
         )
 
     def _save_results(self, jobs: List[Dict], failed_jobs: List[Dict]) -> None:
@@ -343,44 +556,80 @@ class LinkedInJobScraper:
         session = self.Session()
 
         self.logger.info(
-            f"Attempting to save {len(jobs)} successful and {len(failed_jobs)} failed jobs"
+            "Attempting to save %d successful and %d failed jobs",
+            len(jobs),
+            len(failed_jobs),
         )
 
         try:
-            for job_data in jobs:
-                self.logger.info(f"Processing job {job_data['job_id']}")
-                job = Job(
-                    success=True,
-                    url=job_data["url"],
-                    title=job_data["title"],
-                    job_id=job_data["job_id"],
-                    company=job_data["company"],
-                    location=job_data.get("location"),
-                    description=job_data["description"],
-                )
-                session.merge(job)
-
-            for failed in failed_jobs:
-                job = Job(job_id=failed["job_id"], success=False, error=failed["error"])
-                session.merge(job)
+            scraped_date = datetime.utcnow()
+            success_rows = [
+                {
+                    "job_id": job_data["job_id"],
+                    "title": job_data["title"],
+                    "company": job_data["company"],
+                    "description": job_data["description"],
+                    "url": job_data["url"],
+                    "location": job_data.get("location"),
+                    "scraped_date": scraped_date,
+                    "success": True,
+                    "error": None,
+                }
+                for job_data in jobs
+            ]
+            failed_rows = [
+                {
+                    "job_id": failed["job_id"],
+                    "scraped_date": scraped_date,
+                    "success": False,
+                    "error": failed["error"],
+                }
+                for failed in failed_jobs
+            ]
+
+            self._upsert_jobs(session, success_rows)
+            self._upsert_jobs(session, failed_rows)
 
             session.commit()
             self.logger.info(
-                f"Saved {len(jobs)} successful and {len(failed_jobs)} failed jobs to database"
+                "Saved %d successful and %d failed jobs to database",
+                len(jobs),
+                len(failed_jobs),
             )
 
         except Exception as e:
-            self.logger.error(f"Database error: {str(e)}")
+            self.logger.error("Database error: %s", e)
             session.rollback()
 
         finally:
             session.close()
 
+    def _upsert_jobs(self, session, rows: List[Dict]) -> None:
+        """
+        Inserts job rows in batches, updating existing rows with the same job_id.
+
+        Args:
+            session: SQLAlchemy session
+            rows: Column mappings for the jobs table, all sharing the same keys
+        """
+        for start in range(0, len(rows), LinkedInConstants.DB_BATCH_SIZE):
+            stmt = insert(Job).values(
+                rows[start : start + LinkedInConstants.DB_BATCH_SIZE]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Job.job_id],
+                set_={key: stmt.excluded[key] for key in rows[0] if key != "job_id"},
+            )
+            session.execute(stmt)
+
 
 def main():
     config = ScraperConfig.from_env()
     scraper = LinkedInJobScraper(config)
-    scraper.scrape_jobs()
+    try:
+        scraper.scrape_jobs()
+    finally:
+        scraper.close()
 
 
 if __name__ == "__main__":
@@ -1,26 +1,95 @@
+import atexit
 import logging
+import os
+import queue
+import random
+import threading
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
+
+import requests
 
 
 def setup_logging():
     """
     Configures logging for the scraper.
+
+    Records are pushed to a queue and written to stderr by a background
+    listener thread, so logging calls never block on I/O. The level defaults
+    to WARNING and can be changed with the LOG_LEVEL environment variable.
+
     Returns configured logger instance.
     """
-    logging.basicConfig(
-        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-    )
-    return logging.getLogger(__name__)
+    logger = logging.getLogger("linkedin_scraper")
+
+    if not logger.handlers:
+        log_queue = queue.SimpleQueue()
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(
+            logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+        )
+
+        listener = QueueListener(log_queue, stream_handler)
+        listener.start()
+        atexit.register(listener.stop)
+
+        logger.addHandler(QueueHandler(log_queue))
+        logger.propagate = False
+
+        level_name = os.getenv("LOG_LEVEL", "WARNING").upper()
+        level = logging.getLevelNamesMapping().get(level_name)
+        logger.setLevel(logging.WARNING if level is None else level)
+        if level is None:
+            logger.warning("Unknown LOG_LEVEL %r, using WARNING", level_name)
+
+    return logger
+
+
+class TransientHTTPError(requests.HTTPError):
+    """HTTP error worth retrying, such as rate limiting or a server error."""
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds the server asked to wait via Retry-After, or 0 if unset."""
+        if self.response is None:
+            return 0.0
+
+        value = self.response.headers.get("Retry-After")
+        if not value:
+            return 0.0
 
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
 
-def retry_on_failure(max_retries=3, delay=1):
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return 0.0
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def retry_on_failure(
+    max_retries=3,
+    base=0.5,
+    cap=8.0,
+    exceptions=(requests.ConnectionError, requests.Timeout, TransientHTTPError),
+):
     """
-    Decorator that retries failed function calls.
+    Decorator that retries failed function calls with exponential backoff.
+
+    A TransientHTTPError carrying a Retry-After header waits at least that long.
 
     Args:
-        max_retries: Maximum number of retry attempts
-        delay: Delay between retries in seconds
+        max_retries: Maximum number of attempts
+        base: Delay before the first retry in seconds
+        cap: Upper bound for the backoff delay between retries in seconds
+        exceptions: Exception types worth retrying, anything else is raised
+            right away
 
     Returns:
         Wrapped function that implements retry logic
@@ -32,12 +101,39 @@ def retry_on_failure(max_retries=3, delay=1):
             for attempt in range(max_retries):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
+                except exceptions as e:
                     if attempt == max_retries - 1:
                         raise
-                    time.sleep(delay * (attempt + 1))
+                    delay = min(cap, base * 2**attempt) * (0.5 + random.random())
+                    if isinstance(e, TransientHTTPError):
+                        delay = max(delay, e.retry_after)
+                    time.sleep(delay)
             return None
 
         return wrapper
 
     return decorator
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces out calls to a fixed rate.
+
+    Args:
+        rate: Maximum number of calls per second
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self.lock = threading.Lock()
+        self.next_call = 0.0
+
+    def wait(self):
+        """Blocks until the caller is allowed to proceed."""
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_call - now
+            self.next_call = max(now, self.next_call) + self.interval
+
+        if delay > 0:
+            time.sleep(delay)
@@ -0,0 +1,265 @@
+import logging
+
+import pytest
+import requests
+from bs4 import BeautifulSoup
+from sqlalchemy import func, select
+
+from linkedin_scraper import utils
+from linkedin_scraper.config import ScraperConfig
+from linkedin_scraper.constants import LinkedInConstants
+from linkedin_scraper.models import Job
+from linkedin_scraper.scraper import JOB_DETAILS_STRAINER, LinkedInJobScraper
+
+GUEST_JOB_POSTING_HTML = """
+<html>
+  <body>
+    <section class="top-card-layout container-lined">
+      <h2 class="top-card-layout__title font-sans topcard__title">
+        Senior Python Developer
+      </h2>
+      <h4 class="top-card-layout__second-subline">
+        <span class="topcard__flavor">
+          <a class="topcard__org-name-link topcard__flavor--black-link"
+             href="https://www.linkedin.com/company/acme">
+            Acme Corp
+          </a>
+        </span>
+        <span class="topcard__flavor topcard__flavor--bullet">
+          Amsterdam, North Holland, Netherlands
+        </span>
+      </h4>
+    </section>
+    <section class="description">
+      <div class="description__text description__text--rich">
+        <div class="show-more-less-html__markup">
+          <p>We offer visa sponsorship.</p>
+          <p>Relocation package included.</p>
+        </div>
+      </div>
+    </section>
+  </body>
+</html>
+"""
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = ScraperConfig(
+        keywords="python",
+        geo_ids=[],
+        date_filter="",
+        contains=[],
+        non_contains=[],
+        linkedin_email="",
+        linkedin_password="",
+    )
+    scraper = LinkedInJobScraper(config)
+    yield scraper
+    scraper.close()
+    scraper.engine.dispose()
+
+
+def test_get_job_details_parses_guest_job_posting(scraper, monkeypatch):
+    monkeypatch.setattr(
+        scraper, "_fetch_job_posting", lambda job_id: GUEST_JOB_POSTING_HTML
+    )
+
+    details = scraper._get_job_details("123")
+
+    assert details == {
+        "job_id": "123",
+        "title": "Senior Python Developer",
+        "company": "Acme Corp",
+        "description": "We offer visa sponsorship.\nRelocation package included.",
+        "url": "https://www.linkedin.com/jobs/search/?currentJobId=123",
+        "location": "Amsterdam, North Holland, Netherlands",
+    }
+
+
+@pytest.mark.parametrize("parser", ["lxml", "html.parser"])
+def test_job_details_strainer_keeps_multi_class_nodes(parser):
+    soup = BeautifulSoup(
+        GUEST_JOB_POSTING_HTML, parser, parse_only=JOB_DETAILS_STRAINER
+    )
+
+    assert [tag.name for tag in soup.find_all(recursive=False)] == [
+        "h2",
+        "a",
+        "span",
+        "div",
+    ]
+
+
+def test_get_job_details_returns_none_on_unexpected_html(scraper, monkeypatch):
+    monkeypatch.setattr(scraper, "_fetch_job_posting", lambda job_id: "<html></html>")
+
+    assert scraper._get_job_details("123") is None
+
+
+class FakeResponse:
+    def __init__(self, status_code, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error", response=self)
+
+
+@pytest.fixture
+def responses(scraper, monkeypatch):
+    """Queue of responses returned by the scraper's HTTP session."""
+    queue = []
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        return queue.pop(0)
+
+    monkeypatch.setattr(scraper.session, "get", fake_get)
+    monkeypatch.setattr(scraper.rate_limiter, "wait", lambda: None)
+    monkeypatch.setattr(utils.time, "sleep", lambda seconds: None)
+    return queue, calls
+
+
+def test_fetch_job_posting_does_not_retry_client_errors(scraper, responses):
+    queue, calls = responses
+    queue.append(FakeResponse(404))
+
+    with pytest.raises(requests.HTTPError):
+        scraper._fetch_job_posting("123")
+
+    assert len(calls) == 1
+
+
+def test_fetch_job_posting_retries_transient_errors(scraper, responses):
+    queue, calls = responses
+    queue.extend([FakeResponse(429), FakeResponse(503), FakeResponse(200, "ok")])
+
+    assert scraper._fetch_job_posting("123") == "ok"
+    assert len(calls) == 3
+
+
+def test_fetch_job_posting_honors_retry_after(scraper, responses, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(utils.time, "sleep", sleeps.append)
+    queue, calls = responses
+    queue.extend(
+        [FakeResponse(429, headers={"Retry-After": "30"}), FakeResponse(200, "ok")]
+    )
+
+    assert scraper._fetch_job_posting("123") == "ok"
+    assert sleeps == [30.0]
+
+
+def test_scrape_jobs_records_parse_failures(scraper, monkeypatch):
+    saved = {}
+    monkeypatch.setattr(scraper, "_get_driver", lambda: None)
+    monkeypatch.setattr(scraper, "_is_logged_in", lambda driver: True)
+    monkeypatch.setattr(
+        scraper, "_get_all_job_ids", lambda driver, keyword, geo_id: ["123"]
+    )
+    monkeypatch.setattr(scraper, "_get_job_details", lambda job_id: None)
+    monkeypatch.setattr(
+        scraper,
+        "_save_results",
+        lambda jobs, failed_jobs: saved.update(jobs=jobs, failed_jobs=failed_jobs),
+    )
+    scraper.config.geo_ids = ["101165590"]
+
+    scraper.scrape_jobs()
+
+    assert saved == {
+        "jobs": [],
+        "failed_jobs": [{"job_id": "123", "error": "parse failed"}],
+    }
+
+
+def test_should_include_job_logs_keyword_matches_per_list(scraper, caplog, monkeypatch):
+    scraper.config.contains = ["java", "javascript", "visa"]
+    scraper.config.non_contains = ["php"]
+    scraper._contains_re = scraper._compile_keywords(scraper.config.contains)
+    scraper._non_contains_re = scraper._compile_keywords(scraper.config.non_contains)
+    monkeypatch.setattr(scraper.logger, "propagate", True)
+
+    with caplog.at_level("DEBUG", logger="linkedin_scraper"):
+        included = scraper._should_include_job(
+            {"job_id": "123", "title": "JavaScript dev", "description": "Visa, PHP"}
+        )
+
+    assert not included
+    assert (
+        "contains=['java', 'javascript', 'visa'] non_contains=['php']" in caplog.text
+    )
+
+
+def make_job(job_id):
+    return {
+        "job_id": job_id,
+        "title": f"Job {job_id}",
+        "company": "Acme Corp",
+        "description": "Visa sponsorship",
+        "url": f"https://www.linkedin.com/jobs/search/?currentJobId={job_id}",
+        "location": "Amsterdam",
+    }
+
+
+def test_save_results_inserts_new_jobs(scraper):
+    scraper._save_results([make_job("1")], [{"job_id": "2", "error": "timeout"}])
+
+    with scraper.Session() as session:
+        jobs = {job.job_id: job for job in session.scalars(select(Job))}
+
+    assert jobs["1"].success and jobs["1"].title == "Job 1"
+    assert not jobs["2"].success and jobs["2"].error == "timeout"
+    assert scraper._get_saved_job_ids() == {"1"}
+
+
+def test_save_results_overwrites_failed_job_with_success(scraper):
+    scraper._save_results([], [{"job_id": "1", "error": "parse failed"}])
+    scraper._save_results([make_job("1")], [])
+
+    with scraper.Session() as session:
+        jobs = session.scalars(select(Job)).all()
+
+    assert len(jobs) == 1
+    assert jobs[0].success
+    assert jobs[0].error is None
+    assert jobs[0].title == "Job 1"
+    assert scraper._get_saved_job_ids() == {"1"}
+
+
+def test_save_results_spans_batches(scraper):
+    count = LinkedInConstants.DB_BATCH_SIZE + 1
+    scraper._save_results([make_job(str(i)) for i in range(count)], [])
+
+    with scraper.Session() as session:
+        assert session.scalar(select(func.count()).select_from(Job)) == count
+
+    assert len(scraper._get_saved_job_ids()) == count
+
+
+def test_setup_logging_falls_back_to_warning_on_unknown_level(monkeypatch):
+    logger = logging.getLogger("linkedin_scraper")
+    monkeypatch.setattr(logger, "handlers", [])
+    monkeypatch.setattr(logger, "level", logger.level)
+    monkeypatch.setenv("LOG_LEVEL", "verbose")
+
+    assert utils.setup_logging().level == logging.WARNING
+
+
+def test_from_env_warns_about_unknown_locations(monkeypatch, caplog):
+    monkeypatch.setattr("linkedin_scraper.config.load_dotenv", lambda: None)
+    monkeypatch.setattr(logging.getLogger("linkedin_scraper"), "propagate", True)
+    monkeypatch.setenv("LOCATIONS", "uk,netherland")
+    ScraperConfig._parse_env.cache_clear()
+
+    with caplog.at_level("WARNING", logger="linkedin_scraper"):
+        config = ScraperConfig.from_env()
+    ScraperConfig._parse_env.cache_clear()
+
+    assert config.geo_ids == [ScraperConfig.LOCATION_MAP["uk"]]
+    assert "Unknown location 'netherland'" in caplog.text